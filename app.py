@@ -24,6 +24,9 @@ UPLOAD_FOLDER = 'uploads'
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
+# Configure certificate view cache
+app.config['CERTIFICATE_VIEW_CACHE_SIZE'] = int(os.environ.get("CERTIFICATE_VIEW_CACHE_SIZE", 256))
+
 # Configure the database
 app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL", "sqlite:///certificate_system.db")
 app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
@@ -0,0 +1,74 @@
+import threading
+from collections import OrderedDict
+from app import app
+
+class CertificateViewCache:
+    """
+    LRU cache for the verification payload and rendered fragment of
+    anchored certificates, keyed by (certificate id, block hash)
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._anchors = {}  # certificate id -> block hash it was anchored in
+        self._lock = threading.Lock()
+
+    def get(self, certificate_id):
+        """Return the cached entry for a certificate, or None on a miss"""
+        with self._lock:
+            block_hash = self._anchors.get(certificate_id)
+            entry = self._entries.get((certificate_id, block_hash)) if block_hash else None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end((certificate_id, block_hash))
+            self.hits += 1
+            return entry
+
+    def set(self, certificate_id, block_hash, entry):
+        """Store an entry, evicting the least recently used ones past the size bound"""
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            key = (certificate_id, block_hash)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._anchors[certificate_id] = block_hash
+
+            while len(self._entries) > self.max_entries:
+                (evicted_id, _), _ = self._entries.popitem(last=False)
+                self._anchors.pop(evicted_id, None)
+
+    def invalidate_user(self, user_id):
+        """Drop every entry owned by a user (their certificate count changed)"""
+        with self._lock:
+            for key in [k for k, e in self._entries.items() if e['user_id'] == user_id]:
+                del self._entries[key]
+                self._anchors.pop(key[0], None)
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._anchors.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self):
+        """Get cache statistics"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+# Global certificate view cache instance
+certificate_view_cache = CertificateViewCache(max_entries=app.config['CERTIFICATE_VIEW_CACHE_SIZE'])
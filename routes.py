@@ -3,10 +3,12 @@ import hashlib
 from datetime import datetime, timedelta
 from flask import render_template, request, redirect, url_for, flash, session, send_file
 from flask_login import login_user, logout_user, login_required, current_user
+from markupsafe import Markup
 from werkzeug.utils import secure_filename
 from app import app, db
 from models import User, Company, Certificate, AccessCode
 from blockchain import blockchain
+from cache import certificate_view_cache
 
 ALLOWED_EXTENSIONS = {'pdf', 'png', 'jpg', 'jpeg'}
 
@@ -142,6 +144,9 @@ def upload_certificate():
             db.session.add(certificate)
             db.session.commit()
             
+            # Owner's certificate count is part of cached verification pages
+            certificate_view_cache.invalidate_user(current_user.id)
+            
             flash('Certificate uploaded and stored on blockchain successfully!', 'success')
         except Exception as e:
             # Clean up file if blockchain operation fails
@@ -304,16 +309,41 @@ def view_certificate(access_code):
         flash('Invalid or expired access code', 'error')
         return redirect(url_for('index'))
     
-    certificate = code_obj.certificate
-    user = code_obj.user
+    # Certificate, owner and block proof never change once anchored,
+    # so only the access code check above runs on a cache hit
+    cached = certificate_view_cache.get(code_obj.certificate_id)
     
-    # Get blockchain verification
-    blockchain_verification = blockchain.get_certificate_verification(certificate.file_hash)
+    if cached is None:
+        certificate = code_obj.certificate
+        user = code_obj.user
+        
+        # Get blockchain verification
+        blockchain_verification = blockchain.get_certificate_verification(certificate.file_hash)
+        
+        cached = {
+            'user_id': user.id,
+            'certificate': {'original_filename': certificate.original_filename},
+            'user': {
+                'full_name': user.full_name,
+                'username': user.username,
+                'email': user.email
+            },
+            'blockchain_verification': blockchain_verification,
+            'verification_fragment': Markup(render_template('certificate_verification.html',
+                                                            certificate=certificate,
+                                                            user=user,
+                                                            blockchain_verification=blockchain_verification))
+        }
+        
+        # Unverified certificates are not cached so they are re-checked on every view
+        if blockchain_verification['verified']:
+            certificate_view_cache.set(certificate.id, blockchain_verification['block_hash'], cached)
     
     return render_template('certificate_view.html', 
-                         certificate=certificate, 
-                         user=user,
-                         blockchain_verification=blockchain_verification,
+                         certificate=cached['certificate'], 
+                         user=cached['user'],
+                         blockchain_verification=cached['blockchain_verification'],
+                         verification_fragment=cached['verification_fragment'],
                          access_code=access_code)
 
 @app.route('/download_certificate/<access_code>')